@@ -1,14 +1,28 @@
 """
 Relic's V10.0 Specification for SGA files.
 """
+from typing import TYPE_CHECKING, Any
+
 from relic.sga.v10.definitions import (
     version,
 )
 
-from relic.sga.v10.serialization import essence_fs_serializer as EssenceFSHandler
+if TYPE_CHECKING:
+    from relic.sga.v10.serialization import essence_fs_serializer as EssenceFSHandler
 
 __version__ = "1.0.0"
 
+
+def __getattr__(name: str) -> Any:
+    # Deferred; importing the package (e.g. for `version`) shouldn't build the serializer
+    if name == "EssenceFSHandler":
+        # pylint: disable=import-outside-toplevel
+        from relic.sga.v10.serialization import essence_fs_serializer
+
+        return essence_fs_serializer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "EssenceFSHandler",
     "version",
@@ -3,47 +3,190 @@ Binary Serializers for Relic's SGA-V10
 """
 from __future__ import annotations
 
+import struct
+import threading
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import BinaryIO, Dict, Tuple, cast
+from functools import lru_cache
+from struct import Struct
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Protocol,
+    Tuple,
+    Union,
+    runtime_checkable,
+)
 
-from serialization_tools.structx import Struct
 from relic.core.errors import MismatchError
 from relic.sga.core import serialization as _s
-from relic.sga.core.definitions import StorageType, VerificationType
-from relic.sga.core.filesystem import registry
-from relic.sga.core.protocols import StreamSerializer
+from relic.sga.core.definitions import (
+    StorageType,
+    VerificationType,
+    MagicWord,
+    Version,
+    _validate_magic_word,
+)
+from relic.sga.core.errors import VersionMismatchError
+from relic.sga.core.filesystem import EssenceFS, registry
+from relic.sga.core.protocols import StreamSerializer, T
 from relic.sga.core.serialization import (
     FileDef as BaseFileDef,
     ArchivePtrs,
+    DriveDef,
+    FolderDef,
     TocBlock,
     TOCSerializationInfo,
 )
 from relic.sga.v10.definitions import version
 
+_Buffer = Union[bytes, bytearray, memoryview]
+
 
 @dataclass
 class TocFooter:
+    __slots__ = ("unk_a", "unk_b", "block_size")
+
     unk_a: int
     unk_b: int
     block_size: int
 
 
+class _RecordBuffer(threading.local):
+    """
+    Reads/writes a single fixed-size record through a per-thread buffer.
+
+    Serializers are shared module-level instances; a thread-local buffer lets them
+    reuse one allocation per record while staying safe to use across threads.
+    """
+
+    def __init__(self, layout: Struct):
+        super().__init__()
+        self.layout = layout
+        self.buffer = bytearray(layout.size)
+        self.view = memoryview(self.buffer)
+
+    def unpack(self, stream: BinaryIO) -> Tuple[Any, ...]:
+        """
+        Reads a record from the stream; raises a struct.error if the stream runs out of data.
+
+        BinaryIO doesn't require `readinto`; streams without it are read with `read` instead.
+        """
+        size = len(self.buffer)
+        buffer: _Buffer
+        if hasattr(stream, "readinto"):
+            read = stream.readinto(self.view)
+            buffer = self.buffer
+        else:
+            buffer = stream.read(size)
+            read = len(buffer)
+        if read != size:
+            raise struct.error(f"unpack requires a buffer of {size} bytes")
+        record: Tuple[Any, ...] = self.layout.unpack_from(buffer)
+        return record
+
+    def pack(self, stream: BinaryIO, *args: Any) -> int:
+        """Writes a record to the stream, returning the number of bytes written."""
+        self.layout.pack_into(self.buffer, 0, *args)
+        written: int = stream.write(self.buffer)
+        return written
+
+
+@runtime_checkable
+class BulkStreamSerializer(StreamSerializer[T], Protocol[T]):
+    """A StreamSerializer of fixed-size records, which can also parse a run of consecutive records from a buffer."""
+
+    layout: Struct
+
+    def unpack_many_from(self, buffer: _Buffer, offset: int, count: int) -> List[T]:
+        """
+        Converts `count` consecutive records from the buffer to parsed data.
+
+        :param buffer: The buffer to read from.
+        :param offset: The position of the first record in the buffer.
+        :param count: The number of records to read.
+
+        :return: The parsed data, in buffer order.
+        """
+        raise NotImplementedError
+
+
+class _RecordSerializer(Generic[T]):  # pylint: disable=too-few-public-methods
+    """
+    Buffer & bulk reading shared by the fixed-size record serializers.
+
+    Subclasses convert a single unpacked record to its definition via `_parse`, and back via `_args`.
+    """
+
+    layout: Struct
+
+    def _parse(self, record: Tuple[Any, ...]) -> T:
+        raise NotImplementedError
+
+    def _args(self, value: T) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def unpack_many_from(self, buffer: _Buffer, offset: int, count: int) -> List[T]:
+        """Unpacks `count` consecutive records from the buffer."""
+        parse = self._parse
+        return [parse(record) for record in self._iter_records(buffer, offset, count)]
+
+    def _iter_records(
+        self, buffer: _Buffer, offset: int, count: int
+    ) -> Iterator[Tuple[Any, ...]]:
+        size = self.layout.size * count
+        view = memoryview(buffer)[offset : offset + size]
+        if len(view) != size:
+            raise struct.error(f"unpack requires a buffer of {size} bytes")
+        records: Iterator[Tuple[Any, ...]] = self.layout.iter_unpack(view)
+        return records
+
+
 class EncryptionType(IntEnum):
     NONE = 0
     AES128 = 1
 
 
+# Value -> member lookups
+# Misses fall back to calling the Enum, which raises the usual ValueError
+_STORAGE_BY_VALUE: Dict[int, StorageType] = {m.value: m for m in StorageType}
+# Storage/Encryption flag byte -> (StorageType, raw encryption); low nibble is storage, high nibble is encryption
+# Only valid storage nibbles are present; so a miss still falls back to the Enum's ValueError
+_FLAGS_TABLE: Dict[int, Tuple[StorageType, int]] = {
+    (encryption << 4) | storage.value: (storage, encryption)
+    for storage in StorageType
+    for encryption in range(16)
+}
+
+
 @dataclass
 class FileDef(BaseFileDef):
+    # Core's FileDef is not slotted, so only the V10 fields can live in slots
+    __slots__ = ("verification", "encryption", "crc", "hash_pos")
+
     # modified: datetime
-    verification: VerificationType
-    encryption: EncryptionType
+    # Raw values, as stored in the archive; use `verification_enum` / `encryption_enum` for the Enum members
+    verification: int
+    encryption: int
     crc: int
     hash_pos: int
 
+    @property
+    def verification_enum(self) -> VerificationType:
+        """The verification type; raises a ValueError if the value is unknown."""
+        return VerificationType(self.verification)
 
-class FileDefSerializer(StreamSerializer[FileDef]):
+    @property
+    def encryption_enum(self) -> EncryptionType:
+        """The encryption type; raises a ValueError if the value is unknown."""
+        return EncryptionType(self.encryption)
+
+
+class FileDefSerializer(_RecordSerializer[FileDef], StreamSerializer[FileDef]):
     """
     Serializes File information using the V9 format.
     """
@@ -54,9 +197,49 @@ class FileDefSerializer(StreamSerializer[FileDef]):
 
     def __init__(self, layout: Struct):
         self.layout = layout
+        record = _RecordBuffer(layout)
+        self._unpack_record = record.unpack
+        self._pack_record = record.pack
 
     def unpack(self, stream: BinaryIO) -> FileDef:
         """Unpacks a File Definition from the stream."""
+        return self._parse(self._unpack_record(stream))
+
+    def unpack_many_from(
+        self, buffer: _Buffer, offset: int, count: int
+    ) -> List[FileDef]:
+        """Unpacks `count` consecutive File Definitions from the buffer."""
+        flags_table = _FLAGS_TABLE
+        try:
+            return [
+                FileDef(
+                    name_pos,
+                    data_pos,
+                    length_on_disk,
+                    length_in_archive,
+                    storage_type,
+                    verification,
+                    encryption,
+                    crc,
+                    hash_pos,
+                )
+                for (
+                    name_pos,
+                    hash_pos,
+                    data_pos,
+                    length_in_archive,
+                    length_on_disk,
+                    verification,
+                    flags,
+                    crc,
+                ) in self._iter_records(buffer, offset, count)
+                for storage_type, encryption in (flags_table[flags],)
+            ]
+        except KeyError:
+            # An unknown storage type; the generic path raises the Enum's ValueError
+            return super().unpack_many_from(buffer, offset, count)
+
+    def _parse(self, record: Tuple[Any, ...]) -> FileDef:
         (
             name_rel_pos,
             hash_pos,
@@ -67,49 +250,49 @@ class FileDefSerializer(StreamSerializer[FileDef]):
             verification_type_val,
             storage_and_encryption_flags,
             crc,
-        ) = self.layout.unpack_stream(stream)
-
-        storage_value = storage_and_encryption_flags & self.STORAGE_MASK
-        encryption_value = (
-            storage_and_encryption_flags & self.ENCRYPTION_MASK
-        ) >> self.ENCRYPTION_SHIFT
-        storage_type: StorageType = StorageType(storage_value)
-        encryption_type = EncryptionType(encryption_value)  # None / AES128
-        verification_type: VerificationType = VerificationType(verification_type_val)
+        ) = record
+
+        try:
+            storage_type, encryption = _FLAGS_TABLE[storage_and_encryption_flags]
+        except KeyError:
+            # An unknown storage type; calling the Enum raises the usual ValueError
+            storage_type = StorageType(storage_and_encryption_flags & self.STORAGE_MASK)
+            encryption = storage_and_encryption_flags >> self.ENCRYPTION_SHIFT
+        # Verification and encryption stay raw; they are only validated when read as enums
         return FileDef(
-            name_pos=name_rel_pos,
-            data_pos=data_rel_pos,
-            length_on_disk=length_on_disk,
-            length_in_archive=length_in_archive,
-            storage_type=storage_type,
-            # modified=modified,
-            encryption=encryption_type,
-            verification=verification_type,
-            crc=crc,
-            hash_pos=hash_pos,
+            name_rel_pos,  # name_pos
+            data_rel_pos,  # data_pos
+            length_on_disk,
+            length_in_archive,
+            storage_type,
+            verification_type_val,
+            encryption,  # None / AES128
+            crc,
+            hash_pos,
         )
 
     def pack(self, stream: BinaryIO, value: FileDef) -> int:
+        return self._pack_record(stream, *self._args(value))
+
+    def _args(self, value: FileDef) -> Tuple[Any, ...]:
         # modified: int = int(value.modified.timestamp())
-        storage_type = value.storage_type.value  # convert enum to value
-        encryption_type: int = value.encryption.value
-        verification_type = value.verification.value  # convert enum to value
         storage_and_encryption_flags = (
-            encryption_type << self.ENCRYPTION_SHIFT
-        ) | storage_type
-        args = (
+            value.encryption << self.ENCRYPTION_SHIFT
+        ) | value.storage_type
+        return (
             value.name_pos,
             value.hash_pos,
             value.data_pos,
             value.length_in_archive,
             value.length_on_disk,
-            verification_type,
+            value.verification,
             storage_and_encryption_flags,
             # modified,
             value.crc,
         )
-        written: int = self.layout.pack_stream(stream, *args)
-        return written
+
+
+_DEFAULT_SHA256: bytes = b"default hash.   " * 16
 
 
 @dataclass
@@ -118,6 +301,8 @@ class MetaBlock(_s.MetaBlock):
     Container for header information used by V9
     """
 
+    __slots__ = ("sha_256",)
+
     name: str
     ptrs: ArchivePtrs
     sha_256: bytes
@@ -125,22 +310,24 @@ class MetaBlock(_s.MetaBlock):
     @classmethod
     def default(cls) -> MetaBlock:
         """Returns a Default, 'garbage' instance which can be used as a placeholder for write-backs."""
-        default_sha256: bytes = b"".join([b"default hash.   "] * 16)
-        return cls("Default Meta Block", ArchivePtrs.default(), default_sha256)
+        return cls("Default Meta Block", ArchivePtrs.default(), _DEFAULT_SHA256)
 
 
-@dataclass
 class ArchiveHeaderSerializer(StreamSerializer[MetaBlock]):
     """
     Serializer to convert header information to it's dataclass; ArchiveHeader
     """
 
-    layout: Struct
-
     ENCODING = "utf-16-le"
     RSV_0 = 0
     RSV_1 = 1
 
+    def __init__(self, layout: Struct):
+        self.layout = layout
+        record = _RecordBuffer(layout)
+        self._unpack_record = record.unpack
+        self._pack_record = record.pack
+
     def unpack(self, stream: BinaryIO) -> MetaBlock:
         """Unpacks a MetaBlock from the stream."""
         (
@@ -152,8 +339,12 @@ class ArchiveHeaderSerializer(StreamSerializer[MetaBlock]):
             rsv_0,  # 0 ~ 4b
             rsv_1,  # 1 ~ 4b
             sha_256,  # 256b of something (following is 0x78 0xda (zlib header) & @ 0x01ac)
-        ) = self.layout.unpack_stream(stream)
-        name = encoded_name.decode(self.ENCODING).rstrip("\0")
+        ) = self._unpack_record(stream)
+        # Strip the NUL padding before decoding; rounding up to an even length keeps the
+        #   last code unit whole when its high byte is NUL (e.g. ASCII characters)
+        name_size = len(encoded_name.rstrip(b"\0"))
+        name_size += name_size & 1
+        name = encoded_name[:name_size].decode(self.ENCODING)
         ptrs = ArchivePtrs(header_pos, header_size, data_pos, data_size)
         if (rsv_0, rsv_1) != (self.RSV_0, self.RSV_1):
             raise MismatchError(
@@ -175,23 +366,160 @@ class ArchiveHeaderSerializer(StreamSerializer[MetaBlock]):
             self.RSV_1,
             value.sha_256,
         )
-        written: int = self.layout.pack_stream(stream, *args)
-        return written
+        return self._pack_record(stream, *args)
 
 
-@dataclass
 class TocFooterSerializer(StreamSerializer[TocFooter]):
-    layout: Struct
+    def __init__(self, layout: Struct):
+        self.layout = layout
+        record = _RecordBuffer(layout)
+        self._unpack_record = record.unpack
+        self._pack_record = record.pack
 
     def unpack(self, stream: BinaryIO) -> TocFooter:
-        (unk_a, unk_b, block_size) = self.layout.unpack_stream(stream)
+        unk_a, unk_b, block_size = self._unpack_record(stream)
 
         return TocFooter(unk_a, unk_b, block_size)
 
     def pack(self, stream: BinaryIO, value: TocFooter) -> int:
         args = (value.unk_a, value.unk_b, value.block_size)
-        written: int = self.layout.pack_stream(stream, *args)
-        return written
+        return self._pack_record(stream, *args)
+
+
+class TocHeaderSerializer(_s.TocHeaderSerializer):
+    """
+    Core's TocHeaderSerializer; reading/writing through a reusable record buffer.
+    """
+
+    def __init__(self, layout: Struct):
+        super().__init__(layout)
+        record = _RecordBuffer(layout)
+        self._unpack_record = record.unpack
+        self._pack_record = record.pack
+
+    def unpack(self, stream: BinaryIO) -> TocBlock:
+        (
+            drive_pos,
+            drive_count,
+            folder_pos,
+            folder_count,
+            file_pos,
+            file_count,
+            name_pos,
+            name_count,
+        ) = self._unpack_record(stream)
+
+        return TocBlock(
+            (drive_pos, drive_count),
+            (folder_pos, folder_count),
+            (file_pos, file_count),
+            (name_pos, name_count),
+        )
+
+    def pack(self, stream: BinaryIO, value: TocBlock) -> int:
+        args = (
+            value.drive_info[0],
+            value.drive_info[1],
+            value.folder_info[0],
+            value.folder_info[1],
+            value.file_info[0],
+            value.file_info[1],
+            value.name_info[0],
+            value.name_info[1],
+        )
+        return self._pack_record(stream, *args)
+
+
+class DriveDefSerializer(_RecordSerializer[DriveDef], _s.DriveDefSerializer):
+    """
+    Core's DriveDefSerializer; reading/writing through a reusable record buffer, with support for bulk reads.
+    """
+
+    def __init__(self, layout: Struct):
+        super().__init__(layout)
+        record = _RecordBuffer(layout)
+        self._unpack_record = record.unpack
+        self._pack_record = record.pack
+
+    def unpack(self, stream: BinaryIO) -> DriveDef:
+        return self._parse(self._unpack_record(stream))
+
+    def _parse(self, record: Tuple[Any, ...]) -> DriveDef:
+        encoded_alias: bytes
+        encoded_name: bytes
+        (
+            encoded_alias,
+            encoded_name,
+            folder_start,
+            folder_end,
+            file_start,
+            file_end,
+            root_folder,
+        ) = record
+        alias: str = encoded_alias.rstrip(b"\0").decode("ascii")
+        name: str = encoded_name.rstrip(b"\0").decode("ascii")
+        return DriveDef(
+            alias=alias,
+            name=name,
+            root_folder=root_folder,
+            folder_range=(folder_start, folder_end),
+            file_range=(file_start, file_end),
+        )
+
+    def pack(self, stream: BinaryIO, value: DriveDef) -> int:
+        return self._pack_record(stream, *self._args(value))
+
+    def _args(self, value: DriveDef) -> Tuple[Any, ...]:
+        return (
+            value.alias.encode("ascii"),
+            value.name.encode("ascii"),
+            value.folder_range[0],
+            value.folder_range[1],
+            value.file_range[0],
+            value.file_range[1],
+            value.root_folder,
+        )
+
+
+class FolderDefSerializer(_RecordSerializer[FolderDef], _s.FolderDefSerializer):
+    """
+    Core's FolderDefSerializer; reading/writing through a reusable record buffer, with support for bulk reads.
+    """
+
+    def __init__(self, layout: Struct):
+        super().__init__(layout)
+        record = _RecordBuffer(layout)
+        self._unpack_record = record.unpack
+        self._pack_record = record.pack
+
+    def unpack(self, stream: BinaryIO) -> FolderDef:
+        return self._parse(self._unpack_record(stream))
+
+    def _parse(self, record: Tuple[Any, ...]) -> FolderDef:
+        (
+            name_pos,
+            folder_start,
+            folder_end,
+            file_start,
+            file_end,
+        ) = record
+        return FolderDef(
+            name_pos=name_pos,
+            folder_range=(folder_start, folder_end),
+            file_range=(file_start, file_end),
+        )
+
+    def pack(self, stream: BinaryIO, value: FolderDef) -> int:
+        return self._pack_record(stream, *self._args(value))
+
+    def _args(self, value: FolderDef) -> Tuple[Any, ...]:
+        return (
+            value.name_pos,
+            value.folder_range[0],
+            value.folder_range[1],
+            value.file_range[0],
+            value.file_range[1],
+        )
 
 
 def assemble_meta(
@@ -210,15 +538,19 @@ def disassemble_meta(
     _: BinaryIO, metadata: Dict[str, object]
 ) -> Tuple[MetaBlock, TocFooter]:
     """Converts the archive's metadata dictionary into a MetaBlock class the Serializer can use."""
+    sha_256 = metadata["sha_256"]
+    # Stored as a hex string; raw bytes are also accepted
+    if isinstance(sha_256, str):
+        sha_256 = bytes.fromhex(sha_256)
     meta = MetaBlock(
         None,  # type: ignore
         None,  # type: ignore
-        sha_256=bytes.fromhex(cast(str, metadata["sha_256"])),
+        sha_256=sha_256,  # type: ignore[arg-type]
     )
     footer = TocFooter(
-        unk_a=cast(int, metadata["unk_a"]),
-        unk_b=cast(int, metadata["unk_b"]),
-        block_size=cast(int, metadata["block_size"]),
+        unk_a=metadata["unk_a"],  # type: ignore[arg-type]
+        unk_b=metadata["unk_b"],  # type: ignore[arg-type]
+        block_size=metadata["block_size"],  # type: ignore[arg-type]
     )
     return meta, footer
 
@@ -233,11 +565,18 @@ def meta2def(meta: Dict[str, object]) -> FileDef:
     """
     Converts metadata to a File Definitions
     """
-    verification = VerificationType(cast(int, meta["verification_type"]))
-    encryption = EncryptionType(cast(int, meta["encryption_type"]))
-    storage_type = StorageType(cast(int, meta["storage_type"]))
-    hash_pos = cast(int, meta["hash_pos"])
-    crc = cast(int, meta["crc"])
+    storage_value: int = meta["storage_type"]  # type: ignore[assignment]
+    try:
+        storage_type = _STORAGE_BY_VALUE[storage_value]
+    except KeyError:
+        storage_type = StorageType(storage_value)
+    verification: int = meta["verification_type"]  # type: ignore[assignment]
+    encryption: int = meta["encryption_type"]  # type: ignore[assignment]
+    # Unknown types are written as-is (see FileDef); but they must still fit in their fields
+    if not 0 <= verification <= 0xFF:
+        raise ValueError(f"verification_type must fit in a byte; got {verification!r}")
+    if not 0 <= encryption <= 0x0F:
+        raise ValueError(f"encryption_type must fit in a nibble; got {encryption!r}")
     return FileDef(
         None,  # type: ignore
         None,  # type: ignore
@@ -247,25 +586,92 @@ def meta2def(meta: Dict[str, object]) -> FileDef:
         # modified=modified,
         verification=verification,
         encryption=encryption,
-        hash_pos=hash_pos,
-        crc=crc,
+        hash_pos=meta["hash_pos"],  # type: ignore[arg-type]
+        crc=meta["crc"],  # type: ignore[arg-type]
     )
 
 
 def def2meta(_def: FileDef) -> Dict[str, object]:
     # modified_seconds = int(time.mktime(_def.modified.timetuple()))
-    encryption = int(_def.encryption)
-    verification = int(_def.verification)
-    storage_type = int(_def.storage_type)
+    # pylint: disable=protected-access
     return {
-        "storage_type": storage_type,
-        "verification_type": verification,
-        "encryption_type": encryption,
+        "storage_type": _def.storage_type._value_,
+        "verification_type": _def.verification,
+        "encryption_type": _def.encryption,
         "hash_pos": _def.hash_pos,
         "crc": _def.crc,
     }
 
 
+def _unpack_toc_names(buffer: _Buffer) -> Dict[int, str]:
+    """Splits a size-based NAME block into names, keyed by their offset in the block."""
+    names: Dict[int, str] = {}
+    offset = 0
+    for part in bytes(buffer).split(b"\0"):
+        names[offset] = part.decode("ascii")
+        offset += len(part) + 1
+    return names
+
+
+def _read_toc_window(
+    stream: BinaryIO, header_pos: int, regions: List[Tuple[int, int]]
+) -> Tuple[memoryview, List[int]]:
+    """
+    Reads the span of the TOC covering every non-empty (position, size) region in one call.
+
+    Returns the span, and each region's offset into it.
+    """
+    used = [(pos, size) for pos, size in regions if size > 0]
+    start = min((pos for pos, _ in used), default=0)
+    end = max((pos + size for pos, size in used), default=0)
+
+    stream.seek(header_pos + start)
+    window = memoryview(stream.read(end - start))
+    if len(window) != end - start:
+        raise struct.error(f"unpack requires a buffer of {end - start} bytes")
+    # Empty regions may lie outside the window; they're 'read' from its start instead
+    return window, [pos - start if size > 0 else 0 for pos, size in regions]
+
+
+class FSAssembler(_s.FSAssembler[FileDef]):
+    """
+    Assembles the SGA hierarchy; reading the TOC in bulk when its serializers support it.
+
+    If every TOC part can be read in bulk, the whole TOC is read in one call and parsed from memory.
+    Otherwise, the TOC is read by core's per-record reader.
+    """
+
+    def read_toc(
+        self,
+    ) -> Tuple[List[DriveDef], List[FolderDef], List[FileDef], Dict[int, str]]:
+        info = self.toc_serialization_info
+        drive, folder, file = info.drive, info.folder, info.file
+        if (
+            info.name_toc_is_count  # NAME block's size is unknown until it's parsed
+            or not isinstance(drive, BulkStreamSerializer)
+            or not isinstance(folder, BulkStreamSerializer)
+            or not isinstance(file, BulkStreamSerializer)
+        ):
+            return super().read_toc()
+
+        toc = self.toc
+        window, (drive_pos, folder_pos, file_pos, name_pos) = _read_toc_window(
+            self.stream,
+            self.ptrs.header_pos,
+            [
+                (toc.drive_info[0], toc.drive_info[1] * drive.layout.size),
+                (toc.folder_info[0], toc.folder_info[1] * folder.layout.size),
+                (toc.file_info[0], toc.file_info[1] * file.layout.size),
+                toc.name_info,
+            ],
+        )
+        drives = drive.unpack_many_from(window, drive_pos, toc.drive_info[1])
+        folders = folder.unpack_many_from(window, folder_pos, toc.folder_info[1])
+        files = file.unpack_many_from(window, file_pos, toc.file_info[1])
+        names = _unpack_toc_names(window[name_pos : name_pos + toc.name_info[1]])
+        return drives, folders, files, names
+
+
 class EssenceFSSerializer(_s.EssenceFSSerializer[FileDef, MetaBlock, TocFooter]):
     """
     Serializer to read/write an SGA file to/from a stream from/to a SGA File System
@@ -292,41 +698,83 @@ class EssenceFSSerializer(_s.EssenceFSSerializer[FileDef, MetaBlock, TocFooter])
             meta2def=meta2def,
         )
 
+    def read(self, stream: BinaryIO) -> EssenceFS:
+        # Mirrors relic.sga.core.serialization.EssenceFSSerializer.read (relic-tool-sga-core 1.0.x)
+        #   Only the assembler differs; keep the two in sync until core exposes an assembler hook
+        _validate_magic_word(MagicWord, stream, advance=True)
+        stream_version = Version.unpack(stream)
+        if stream_version != self.version:
+            raise VersionMismatchError(stream_version, self.version)
+
+        meta_block = self.meta_serializer.unpack(stream)
+        stream.seek(meta_block.ptrs.header_pos)
+        toc_block = self.toc_serializer.unpack(stream)
+        toc_meta_block = (
+            self.toc_meta_serializer.unpack(stream)
+            if self.toc_meta_serializer is not None
+            else None
+        )
+        metadata = self.assemble_meta(stream, meta_block, toc_meta_block)
+
+        essence_fs = EssenceFS()
+        FSAssembler(
+            stream=stream,
+            ptrs=meta_block.ptrs,
+            toc=toc_block,
+            toc_serialization_info=self.toc_serialization_info,
+            build_file_meta=self.build_file_meta,
+        ).assemble(essence_fs)
+        essence_info: Dict[str, object] = {
+            "name": meta_block.name,
+            "version": {"major": stream_version.major, "minor": stream_version.minor},
+        }
+        if metadata is not None:
+            essence_info.update(metadata)
+
+        essence_fs.setmeta(essence_info, _s.ESSENCE_NAMESPACE)
+        return essence_fs
+
+
+@lru_cache(maxsize=None)
+def _build_essence_fs_serializer() -> EssenceFSSerializer:
+    folder_serializer = FolderDefSerializer(Struct("<5I"))
+    drive_serializer = DriveDefSerializer(Struct("<64s 64s 5I"))
+    file_serializer = FileDefSerializer(Struct("<2I Q 2I 2B I"))
+
+    toc_header_serializer = TocHeaderSerializer(Struct("<8I"))
+    # 0x002c ~ 0x0001 ~ Drive
+    # 0x00c0 ~ 0x000a ~ Folder
+    # 0x0188 ~ 0x0007 ~ Files
+    # 0x025a ~ 0x0157 ~ Names
+
+    toc_footer_serializer = TocFooterSerializer(Struct("<3I"))
+    meta_header_serializer = ArchiveHeaderSerializer(Struct("<128s QI QI 2I 256s"))
+
+    serializer = EssenceFSSerializer(
+        meta_serializer=meta_header_serializer,
+        toc_serializer=toc_header_serializer,
+        toc_footer_serializer=toc_footer_serializer,
+        toc_serialization_info=TOCSerializationInfo(
+            file=file_serializer,
+            drive=drive_serializer,
+            folder=folder_serializer,
+            name_toc_is_count=False,  # AoE4 is size based, not count based
+        ),
+    )
+    registry.auto_register(serializer)
+    return serializer
 
-_folder_layout = Struct("<5I")
-_folder_serializer = _s.FolderDefSerializer(_folder_layout)
-
-_drive_layout = Struct("<64s 64s 5I")
-_drive_serializer = _s.DriveDefSerializer(_drive_layout)
-
-_file_layout = Struct("<2I Q 2I 2B I")
-_file_serializer = FileDefSerializer(_file_layout)
-
-_toc_layout = Struct("<8I")
-_toc_header_serializer = _s.TocHeaderSerializer(_toc_layout)
-# 0x002c ~ 0x0001 ~ Drive
-# 0x00c0 ~ 0x000a ~ Folder
-# 0x0188 ~ 0x0007 ~ Files
-# 0x025a ~ 0x0157 ~ Names
-
-_toc_footer_layout = Struct("<3I")
-_toc_footer_serializer = TocFooterSerializer(_toc_footer_layout)
-_meta_header_layout = Struct("<128s QI QI 2I 256s")
-_meta_header_serializer = ArchiveHeaderSerializer(_meta_header_layout)
-
-essence_fs_serializer = EssenceFSSerializer(
-    meta_serializer=_meta_header_serializer,
-    toc_serializer=_toc_header_serializer,
-    toc_footer_serializer=_toc_footer_serializer,
-    toc_serialization_info=TOCSerializationInfo(
-        file=_file_serializer,
-        drive=_drive_serializer,
-        folder=_folder_serializer,
-        name_toc_is_count=False,  # AoE4 is size based, not count based
-    ),
-)
 
-registry.auto_register(essence_fs_serializer)
+# Built (and registered) on first access instead of on import; see __getattr__
+#   The registry's 'relic.sga.handler' entry points also resolve it this way
+essence_fs_serializer: EssenceFSSerializer
+
+
+def __getattr__(name: str) -> Any:
+    if name == "essence_fs_serializer":
+        return _build_essence_fs_serializer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "FileDefSerializer",
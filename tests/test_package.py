@@ -0,0 +1,30 @@
+import subprocess
+import sys
+import textwrap
+
+
+def _run(source: str) -> None:
+    # A fresh interpreter; this session has most likely imported the serializer already
+    subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(source)], check=True, timeout=60
+    )
+
+
+def test_import_defers_serialization():
+    _run("""
+        import sys
+        import relic.sga.v10
+
+        assert relic.sga.v10.version is not None
+        assert "relic.sga.v10.serialization" not in sys.modules
+        """)
+
+
+def test_registry_resolves_handler():
+    _run("""
+        import relic.sga.v10
+        from relic.sga.core.definitions import Version
+        from relic.sga.core.filesystem import registry
+
+        assert registry.get(Version(10, 0)) is relic.sga.v10.EssenceFSHandler
+        """)
@@ -0,0 +1,270 @@
+import json
+import struct
+from io import BytesIO
+from typing import Callable, List
+
+import pytest
+from relic.sga.core import serialization as _s
+from relic.sga.core.definitions import VerificationType
+from relic.sga.core.filesystem import EssenceFS
+from relic.sga.core.serialization import ArchivePtrs
+
+from relic.sga.v10.serialization import (
+    EncryptionType,
+    FSAssembler,
+    MetaBlock,
+    TocFooter,
+    essence_fs_serializer as serializer,
+)
+
+
+def _empty_fs() -> EssenceFS:
+    essence_fs = EssenceFS()
+    essence_fs.setmeta(
+        {
+            "name": "Test Archive",
+            "sha_256": b"\x01" * 256,
+            "unk_a": 1,
+            "unk_b": 2,
+            "block_size": 3,
+        },
+        "essence",
+    )
+    return essence_fs
+
+
+def _empty_drive_fs() -> EssenceFS:
+    essence_fs = _empty_fs()
+    essence_fs.create_drive("data")
+    return essence_fs
+
+
+def _populated_fs() -> EssenceFS:
+    essence_fs = _empty_fs()
+    drive = essence_fs.create_drive("data")
+    drive.makedir("sub")
+    drive.makedir("empty")
+    for i in range(16):
+        path = f"f{i}.txt" if i % 2 else f"sub/f{i}.txt"
+        drive.writebytes(path, b"hello %d" % i * (i + 1))
+        drive.setinfo(
+            path,
+            {
+                "essence": {
+                    "storage_type": i % 3,
+                    "verification_type": i % 5,
+                    "encryption_type": i % 2,
+                    "hash_pos": i * 7,
+                    "crc": i * 1234567,
+                }
+            },
+        )
+    return essence_fs
+
+
+_FS_BUILDERS: List[Callable[[], EssenceFS]] = [
+    _empty_fs,
+    _empty_drive_fs,
+    _populated_fs,
+]
+
+
+def _write(essence_fs: EssenceFS) -> bytes:
+    with BytesIO() as stream:
+        serializer.write(stream, essence_fs)
+        return stream.getvalue()
+
+
+def _read(archive: bytes) -> EssenceFS:
+    return serializer.read(BytesIO(archive))
+
+
+def _assemblers(archive: bytes) -> List[_s.FSAssembler]:
+    stream = BytesIO(archive)
+    stream.seek(12)  # Magic Word & Version
+    meta = serializer.meta_serializer.unpack(stream)
+    stream.seek(meta.ptrs.header_pos)
+    toc = serializer.toc_serializer.unpack(stream)
+    return [
+        assembler_type(
+            stream=stream,
+            ptrs=meta.ptrs,
+            toc=toc,
+            toc_serialization_info=serializer.toc_serialization_info,
+            build_file_meta=serializer.build_file_meta,
+        )
+        for assembler_type in (FSAssembler, _s.FSAssembler)
+    ]
+
+
+@pytest.mark.parametrize("build_fs", _FS_BUILDERS)
+def test_write_read_round_trip(build_fs: Callable[[], EssenceFS]):
+    archive = _write(build_fs())
+    assert _write(_read(archive)) == archive
+
+
+@pytest.mark.parametrize("build_fs", _FS_BUILDERS)
+def test_read_toc_matches_per_record_read(build_fs: Callable[[], EssenceFS]):
+    bulk, per_record = _assemblers(_write(build_fs()))
+    assert bulk.read_toc() == per_record.read_toc()
+
+
+def test_read_toc_empty_region_before_window():
+    archive = _write(_empty_drive_fs())
+    bulk, per_record = _assemblers(archive)
+    for assembler in (bulk, per_record):
+        # An empty FILE block whose offset lies before the rest of the TOC
+        assembler.toc.file_info = (0, 0)
+    assert bulk.read_toc() == per_record.read_toc()
+
+
+def test_read_truncated_toc():
+    archive = _write(_populated_fs())
+    bulk, _ = _assemblers(archive)
+    toc_end = bulk.ptrs.header_pos + bulk.ptrs.header_size
+    with pytest.raises(struct.error):
+        _read(archive[: toc_end - 8])
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "EngineArtHigh",
+        "\U0001f600",
+        "Engine\U0001f600Art",
+        "EngineArt\U0001f600",
+        "\U0001f600EngineArt",
+        "Engine\u0100",
+    ],
+)
+def test_archive_header_name_round_trip(name: str):
+    header = MetaBlock(name, ArchivePtrs(1, 2, 3, 4), sha_256=b"\x02" * 256)
+    with BytesIO() as stream:
+        serializer.meta_serializer.pack(stream, header)
+        stream.seek(0)
+        assert serializer.meta_serializer.unpack(stream) == header
+
+
+def _file_record(verification: int, flags: int) -> bytes:
+    file_serializer = serializer.toc_serialization_info.file
+    # name_pos, hash_pos, data_pos, length_in_archive, length_on_disk, verification, flags, crc
+    return file_serializer.layout.pack(1, 2, 3, 4, 5, verification, flags, 6)
+
+
+@pytest.mark.parametrize("flags", [0x0F, 0x13])
+def test_unpack_many_from_invalid_storage_type(flags: int):
+    file_serializer = serializer.toc_serialization_info.file
+    records = _file_record(1, 0x00) + _file_record(1, flags)
+    with pytest.raises(ValueError):
+        file_serializer.unpack_many_from(records, 0, 2)
+
+
+def test_unpack_many_from_matches_parse():
+    file_serializer = serializer.toc_serialization_info.file
+    records = [
+        _file_record(verification, flags)
+        for verification, flags in [(0, 0x00), (1, 0x12), (4, 0xF2), (9, 0x31)]
+    ]
+    bulk = file_serializer.unpack_many_from(b"".join(records), 0, len(records))
+    per_record = [
+        file_serializer._parse(file_serializer.layout.unpack(record))
+        for record in records
+    ]
+    assert bulk == per_record
+    assert [(f.storage_type, f.verification, f.encryption) for f in bulk] == [
+        (0, 0, 0),
+        (2, 1, 1),
+        (2, 4, 15),
+        (1, 9, 3),
+    ]
+
+
+def test_file_def_enums():
+    file_serializer = serializer.toc_serialization_info.file
+    file_def = file_serializer._parse(
+        file_serializer.layout.unpack(_file_record(1, 0x10))
+    )
+    assert file_def.verification_enum is VerificationType.CRC
+    assert file_def.encryption_enum is EncryptionType.AES128
+
+
+@pytest.mark.parametrize("verification, flags", [(9, 0x00), (1, 0x20)])
+def test_file_def_unknown_enums(verification: int, flags: int):
+    file_serializer = serializer.toc_serialization_info.file
+    file_def = file_serializer._parse(
+        file_serializer.layout.unpack(_file_record(verification, flags))
+    )
+    with pytest.raises(ValueError):
+        _ = file_def.verification_enum, file_def.encryption_enum
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        ("storage_type", 3),
+        ("verification_type", 256),
+        ("verification_type", -1),
+        ("encryption_type", 16),
+        ("encryption_type", -1),
+    ],
+)
+def test_write_out_of_range_file_metadata(key: str, value: int):
+    file_meta = {
+        "storage_type": 0,
+        "verification_type": 0,
+        "encryption_type": 0,
+        "hash_pos": 0,
+        "crc": 0,
+    }
+    file_meta[key] = value
+    essence_fs = _empty_fs()
+    drive = essence_fs.create_drive("data")
+    drive.writebytes("f.txt", b"hello")
+    drive.setinfo("f.txt", {"essence": file_meta})
+    with pytest.raises(ValueError, match=f"(?i){key.split('_')[0]}"):
+        _write(essence_fs)
+
+
+def _set_sha_256(essence_fs: EssenceFS, sha_256: object) -> None:
+    metadata = dict(essence_fs.getmeta("essence"))
+    metadata["sha_256"] = sha_256
+    essence_fs.setmeta(metadata, "essence")
+
+
+def test_sha_256_metadata_is_hex():
+    essence_fs = _populated_fs()
+    _set_sha_256(essence_fs, (b"\x03" * 256).hex())
+    archive = _write(essence_fs)
+
+    metadata = _read(archive).getmeta("essence")
+    assert metadata["sha_256"] == (b"\x03" * 256).hex()
+    json.dumps(dict(metadata))
+    assert _write(_read(archive)) == archive
+
+
+def test_sha_256_metadata_accepts_bytes():
+    hex_fs, bytes_fs = _populated_fs(), _populated_fs()
+    _set_sha_256(hex_fs, (b"\x01" * 256).hex())
+    assert _write(hex_fs) == _write(bytes_fs)
+
+
+class _ReadOnlyStream:
+    """A stream with `read` but no `readinto`."""
+
+    def __init__(self, data: bytes):
+        self._stream = BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+
+def test_unpack_from_read_only_stream():
+    footer_serializer = serializer.toc_meta_serializer
+    footer = TocFooter(1, 2, 3)
+    with BytesIO() as stream:
+        footer_serializer.pack(stream, footer)
+        data = stream.getvalue()
+
+    assert footer_serializer.unpack(_ReadOnlyStream(data)) == footer
+    with pytest.raises(struct.error):
+        footer_serializer.unpack(_ReadOnlyStream(data[:-1]))